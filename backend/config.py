@@ -117,6 +117,15 @@ class Settings(BaseSettings):
         description="Maximum number of connections per star",
     )
 
+    # Storage Settings
+    quantize_png: bool = Field(
+        default=False,
+        description=(
+            "Quantize uploaded PNGs to a 256-color palette even when lossy "
+            "(images with <= 256 colors are always stored as palette PNGs)"
+        ),
+    )
+
     # Asset Paths
     @property
     def assets_dir(self) -> Path:
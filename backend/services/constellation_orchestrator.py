@@ -278,10 +278,12 @@ class ConstellationOrchestrator:
 
             # Step 9: Add text overlays (title + labels)
             logger.info("[9/11] Adding text overlays...")
+            # composed_image is a fresh per-request object: draw in place
             final_image = self.text_overlay.compose(
                 composed_image,
                 mappings,
-                title
+                title,
+                copy=False,
             )
             logger.info("✓ Text overlays added")
 
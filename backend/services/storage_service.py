@@ -4,20 +4,31 @@ Cloud Storage service for image uploads.
 Uploads generated constellation images to Google Cloud Storage.
 """
 
+import asyncio
+import functools
 import io
 import logging
 import os
+import threading
 import uuid
 
 import google.auth
+import numpy as np
+from google.auth.credentials import Credentials
 from google.cloud import storage
+from google.cloud.storage.retry import DEFAULT_RETRY
 from google.oauth2 import service_account
-from PIL import Image
+from PIL import Image, features
 
 from config import settings
 
 logger = logging.getLogger(__name__)
 
+# Retry failed uploads with exponential backoff: re-sending bytes is far
+# cheaper than regenerating the image. Media uploads only honour the default
+# storage predicate, so only the delays and the overall timeout are tuned
+UPLOAD_RETRY = DEFAULT_RETRY.with_delay(initial=1.0, multiplier=2.0, maximum=8.0).with_timeout(60.0)
+
 
 class StorageError(Exception):
     """Exception for storage operations."""
@@ -36,13 +47,20 @@ class StorageService:
     """
 
     def __init__(self) -> None:
-        """Initialize storage client with credentials."""
-        self._initialize_client()
+        """
+        Initialize storage service.
+
+        Credentials and the storage client are created lazily on first use,
+        so app boot and requests that never upload skip that cost.
+        """
+        # Per-thread bucket handles for upload_many() workers
+        self._local = threading.local()
         logger.info(f"StorageService initialized (bucket: {settings.gcs_bucket_name})")
 
-    def _initialize_client(self) -> None:
+    @functools.cached_property
+    def _credentials(self) -> Credentials:
         """
-        Initialize Google Cloud Storage client.
+        Load Google Cloud credentials (once, on first access).
 
         Uses service account file in development or default credentials in production (Cloud Run).
         """
@@ -51,18 +69,46 @@ class StorageService:
         # Check if credentials file exists (local development)
         if os.path.exists(credentials_path):
             logger.info(f"Using service account file: {credentials_path}")
-            credentials = service_account.Credentials.from_service_account_file(
+            return service_account.Credentials.from_service_account_file(
                 credentials_path
             )
-        else:
-            # Production (Cloud Run) - use default credentials
-            logger.info("Using default environment credentials (Cloud Run)")
-            credentials, _ = google.auth.default()
 
-        self.client = storage.Client(
-            project=settings.gcp_project_id, credentials=credentials
+        # Production (Cloud Run) - use default credentials
+        logger.info("Using default environment credentials (Cloud Run)")
+        credentials, _ = google.auth.default()
+        return credentials
+
+    @functools.cached_property
+    def client(self) -> storage.Client:
+        """Google Cloud Storage client (created on first access)."""
+        return storage.Client(
+            project=settings.gcp_project_id, credentials=self._credentials
         )
-        self.bucket = self.client.bucket(settings.gcs_bucket_name)
+
+    @functools.cached_property
+    def bucket(self) -> storage.Bucket:
+        """Bucket handle for generated images (created on first access)."""
+        return self.client.bucket(settings.gcs_bucket_name)
+
+    def _thread_bucket(self) -> storage.Bucket:
+        """
+        Get a bucket handle owned by the calling thread.
+
+        storage.Client wraps a requests.Session, which is not thread-safe, so
+        each upload_many() worker thread lazily builds its own client from the
+        shared credentials.
+
+        Returns:
+            Bucket bound to a client private to the current thread
+        """
+        bucket = getattr(self._local, "bucket", None)
+        if bucket is None:
+            client = storage.Client(
+                project=settings.gcp_project_id, credentials=self._credentials
+            )
+            bucket = client.bucket(settings.gcs_bucket_name)
+            self._local.bucket = bucket
+        return bucket
 
     async def upload(
         self, image: Image.Image, filename: str | None = None
@@ -84,6 +130,57 @@ class StorageService:
             >>> url = await storage.upload(image)
             >>> print(url)  # https://storage.googleapis.com/bucket/file.png
         """
+        # Encoding and retry backoff block: keep them off the event loop
+        return await asyncio.to_thread(self._sync_upload, image, filename)
+
+    async def upload_many(
+        self, items: list[tuple[Image.Image, str | None]]
+    ) -> list[str]:
+        """
+        Upload several images concurrently and return their public URLs.
+
+        Each upload runs in a worker thread with its own storage client, so
+        wall time is bounded by the slowest upload instead of the sum.
+
+        Args:
+            items: List of (image, optional filename) pairs
+
+        Returns:
+            Public URLs, in the same order as items
+
+        Raises:
+            StorageError: If any upload fails
+
+        Example:
+            >>> urls = await storage.upload_many([(front, None), (back, "back.png")])
+        """
+        return list(
+            await asyncio.gather(
+                *(
+                    asyncio.to_thread(self._sync_upload, image, filename)
+                    for image, filename in items
+                )
+            )
+        )
+
+    def _sync_upload(
+        self,
+        image: Image.Image,
+        filename: str | None = None,
+    ) -> str:
+        """
+        Encode and upload one image (blocking, run in a worker thread).
+
+        Args:
+            image: PIL Image to upload
+            filename: Optional filename (generates UUID if not provided)
+
+        Returns:
+            Public URL to the uploaded image
+
+        Raises:
+            StorageError: If upload fails
+        """
         if filename is None:
             filename = f"{uuid.uuid4()}.png"
 
@@ -94,16 +191,18 @@ class StorageService:
         logger.info(f"Uploading image: {filename}")
 
         try:
+            # Worker threads may run concurrently: use a client private to this
+            # one, resolved here so credential errors are also wrapped in StorageError
+            bucket = self._thread_bucket()
+
             # Convert image to bytes
             image_bytes = self._image_to_bytes(image)
 
             # Create blob
-            blob = self.bucket.blob(filename)
+            blob = bucket.blob(filename)
 
-            # Upload with metadata
-            blob.upload_from_string(
-                image_bytes, content_type="image/png", timeout=60
-            )
+            # Upload with metadata (retried with backoff)
+            self._upload_with_retry(blob, image_bytes)
 
             logger.info(
                 f"Upload successful ({len(image_bytes)} bytes) - {filename}"
@@ -117,10 +216,29 @@ class StorageService:
         except Exception as e:
             raise StorageError(f"Failed to upload image: {e}") from e
 
+    def _upload_with_retry(self, blob: storage.Blob, image_bytes: bytes) -> None:
+        """
+        Upload PNG bytes to a blob, retrying failed attempts.
+
+        Uses the storage DEFAULT_RETRY policy (exponential backoff 1s → 8s,
+        60s overall) instead of failing the whole pipeline on the first
+        network blip.
+
+        Args:
+            blob: Target blob
+            image_bytes: PNG bytes
+        """
+        blob.upload_from_string(
+            image_bytes, content_type="image/png", timeout=60, retry=UPLOAD_RETRY
+        )
+
     def _image_to_bytes(self, image: Image.Image) -> bytes:
         """
         Convert PIL Image to PNG bytes.
 
+        Palette images are encoded with fast compression: they are already
+        3-5x smaller than RGBA and Deflate time is proportional to the input.
+
         Args:
             image: PIL Image
 
@@ -128,10 +246,74 @@ class StorageService:
             PNG bytes
         """
         buffer = io.BytesIO()
-        image.save(buffer, format="PNG", optimize=True)
+        palette_image = self._quantize(image)
+        if palette_image is not None:
+            palette_image.save(buffer, format="PNG", compress_level=1)
+        else:
+            image.save(buffer, format="PNG", optimize=True)
         buffer.seek(0)
         return buffer.read()
 
+    def _quantize(self, image: Image.Image) -> Image.Image | None:
+        """
+        Convert image to a 256-color palette when it pays off.
+
+        Images with at most 256 distinct colors are converted losslessly
+        (alpha included). Other images are only quantized (with dithering)
+        when settings.quantize_png is enabled.
+
+        Args:
+            image: PIL Image
+
+        Returns:
+            Palette ("P") image, or None to keep the original mode
+        """
+        if image.mode not in ("RGB", "RGBA"):
+            return None
+
+        lossless = image.getcolors(256) is not None
+        if not lossless and not settings.quantize_png:
+            return None
+
+        # Opaque images only need an RGB palette
+        if image.mode == "RGBA" and image.getchannel("A").getextrema()[0] == 255:
+            image = image.convert("RGB")
+
+        # No built-in RGBA quantizer is exact: build the palette ourselves
+        if lossless and image.mode == "RGBA":
+            return self._exact_palette(image)
+
+        if features.check_feature("libimagequant") and not lossless:
+            method = Image.Quantize.LIBIMAGEQUANT
+        elif image.mode == "RGB":
+            # Median cut keeps every color exactly when there are <= 256
+            method = Image.Quantize.MEDIANCUT
+        else:
+            method = Image.Quantize.FASTOCTREE
+
+        dither = Image.Dither.NONE if lossless else Image.Dither.FLOYDSTEINBERG
+        return image.quantize(colors=256, method=method, dither=dither)
+
+    def _exact_palette(self, image: Image.Image) -> Image.Image:
+        """
+        Convert an RGBA image with at most 256 colors to an exact RGBA palette.
+
+        Args:
+            image: RGBA PIL Image with at most 256 distinct colors
+
+        Returns:
+            Palette ("P") image that decodes back to the same RGBA pixels
+        """
+        # One uint32 per pixel, bytes kept in RGBA order
+        pixels = np.asarray(image).view(np.uint32)[..., 0]
+        colors, indices = np.unique(pixels, return_inverse=True)
+
+        palette_image = Image.fromarray(
+            indices.astype(np.uint8).reshape(pixels.shape), "P"
+        )
+        palette_image.putpalette(colors.view(np.uint8).tobytes(), rawmode="RGBA")
+        return palette_image
+
     def delete(self, filename: str) -> bool:
         """
         Delete image from storage.
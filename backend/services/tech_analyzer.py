@@ -7,6 +7,10 @@ basés sur la fréquence d'apparition.
 import re
 from typing import Any, Dict, List
 from collections import Counter
+
+import ahocorasick_rs
+import numpy as np
+
 from utils.tech_dictionary import (
     get_all_keywords,
     get_category_for_tech,
@@ -14,6 +18,14 @@ from utils.tech_dictionary import (
 )
 
 
+# Surrogates isolés (extraction PDF abîmée) : non encodables en UTF-8/UTF-32
+_LONE_SURROGATES = re.compile("[\ud800-\udfff]")
+
+# Table de lookup des caractères de mot ASCII [a-zA-Z0-9_] ; les autres
+# caractères sont classés à la volée (voir TechAnalyzer._word_char_mask)
+_ASCII_WORD_CHARS = np.array([chr(c).isalnum() or chr(c) == "_" for c in range(128)])
+
+
 class TechAnalyzer:
     """
     Analyse un CV et extrait les technologies mentionnées.
@@ -22,10 +34,24 @@ class TechAnalyzer:
     et calcule des scores basés sur la fréquence.
     """
 
+    # Seuils de score (inclusifs) et tailles d'étoile correspondantes
+    STAR_SIZE_THRESHOLDS = np.array([20, 50, 80])
+    STAR_SIZES = ("tiny", "small", "medium", "large")
+
     def __init__(self) -> None:
         """Initialise l'analyseur avec le dictionnaire de technologies."""
         self.known_techs = get_all_keywords()
 
+        # Mots-clés uniques en minuscules (le dictionnaire contient des doublons,
+        # ex: "java" est listé dans plusieurs sections)
+        self._tech_keywords = list(dict.fromkeys(t.lower() for t in self.known_techs))
+
+        # Automate Aho-Corasick construit une seule fois : un seul parcours
+        # linéaire du texte trouve tous les mots-clés (implémentation Rust)
+        self._automaton = ahocorasick_rs.AhoCorasick(
+            self._tech_keywords, matchkind=ahocorasick_rs.MatchKind.Standard
+        )
+
     def analyze(self, cv_text: str) -> Dict[str, Any]:
         """
         Analyse le CV et retourne les technologies trouvées.
@@ -76,7 +102,9 @@ class TechAnalyzer:
         """
         Compte les occurrences de chaque technologie dans le texte.
 
-        Utilise des regex avec word boundaries pour éviter les faux positifs.
+        Un seul parcours Aho-Corasick trouve toutes les occurrences (y compris
+        chevauchantes, ex: "react" dans "react native"), puis les word boundaries
+        sont validées et les occurrences comptées de manière vectorisée (NumPy).
         Exemple: "java" ne doit pas matcher dans "javascript"
 
         Args:
@@ -85,22 +113,62 @@ class TechAnalyzer:
         Returns:
             Counter avec {technologie: nombre_occurrences}
         """
-        tech_counter = Counter()
-        text_lower = text.lower()
+        # Remplacement 1 pour 1 par U+FFFD (non-mot, comme avec \b) : les
+        # index des occurrences restent alignés sur le masque des mots
+        text_lower = _LONE_SURROGATES.sub("\ufffd", text.lower())
+
+        # Tuples (id_techno, début, fin) calculés côté Rust
+        matches = self._automaton.find_matches_as_indexes(text_lower, overlapping=True)
+        if not matches:
+            return Counter()
+
+        tech_ids, starts, ends = np.asarray(matches, dtype=np.int64).T
+
+        # Même sémantique que \b : transition caractère de mot / non-mot
+        # aux deux extrémités de l'occurrence
+        word = self._word_char_mask(text_lower)
+        valid = (word[starts] != word[starts + 1]) & (word[ends] != word[ends + 1])
+
+        counts = np.bincount(tech_ids[valid], minlength=len(self._tech_keywords))
+
+        return Counter(
+            {self._tech_keywords[i]: int(counts[i]) for i in np.flatnonzero(counts)}
+        )
+
+    @staticmethod
+    def _word_char_mask(text: str) -> np.ndarray:
+        """
+        Calcule le masque des caractères de mot (même définition que \\w Unicode).
 
-        for tech in self.known_techs:
-            # Pattern avec word boundaries (\b)
-            # \b assure qu'on matche des mots entiers
-            # re.escape() échappe les caractères spéciaux (ex: "c++", ".net")
-            pattern = r'\b' + re.escape(tech) + r'\b'
+        Les caractères ASCII passent par une table de lookup ; les caractères
+        non-ASCII (accents des CV en français) sont classés via str.isalnum()
+        une seule fois par code point distinct, pour que "égo" ou "goûts" ne
+        matchent pas "go".
 
-            # Trouve toutes les occurrences (case-insensitive)
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
+        Le masque est entouré d'un False de chaque côté pour que le début et
+        la fin du texte comptent comme des word boundaries.
 
-            if matches:
-                tech_counter[tech] = len(matches)
+        Args:
+            text: Texte (déjà en minuscules)
 
-        return tech_counter
+        Returns:
+            Tableau booléen de taille len(text) + 2
+        """
+        codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+
+        word = np.zeros(len(codes) + 2, dtype=bool)
+        inner = word[1:-1]
+
+        is_ascii = codes < 128
+        inner[is_ascii] = _ASCII_WORD_CHARS[codes[is_ascii]]
+
+        if not is_ascii.all():
+            non_ascii = ~is_ascii
+            uniques, inverse = np.unique(codes[non_ascii], return_inverse=True)
+            unique_word = np.array([chr(c).isalnum() for c in uniques.tolist()], dtype=bool)
+            inner[non_ascii] = unique_word[inverse]
+
+        return word
 
     def _enrich_tech_data(self, tech_counts: Counter[str]) -> List[Dict[str, Any]]:
         """
@@ -118,57 +186,33 @@ class TechAnalyzer:
         if not tech_counts:
             return []
 
-        # Trouve le maximum pour normaliser les scores
-        max_count = max(tech_counts.values())
-
-        tech_list = []
-
         # Trie par fréquence décroissante (most_common)
-        for tech, count in tech_counts.most_common():
-            # Récupère la catégorie depuis le dictionnaire
-            category = get_category_for_tech(tech)
+        ranked = tech_counts.most_common()
+        counts = np.fromiter(
+            (count for _, count in ranked), dtype=np.int64, count=len(ranked)
+        )
 
-            # Calcule le score normalisé (0-100)
-            normalized_score = int((count / max_count) * 100)
+        # Score normalisé (0-100) : une seule division vectorisée, 100 pour le max
+        scores = (counts / counts.max() * 100).astype(np.int64)
 
-            # Détermine la taille de l'étoile pour la visualisation
-            size = self._compute_star_size(normalized_score)
+        # Taille de l'étoile pour la visualisation, par tranche de score :
+        # < 20 "tiny", < 50 "small", < 80 "medium", sinon "large"
+        size_indices = np.searchsorted(self.STAR_SIZE_THRESHOLDS, scores, side="right")
 
-            # Récupère la couleur de la catégorie
-            color = get_color_for_tech(tech)
+        tech_list = []
 
+        for (tech, count), score, size_idx in zip(ranked, scores, size_indices):
             tech_list.append({
                 "name": tech.title(),  # Capitalisation propre
-                "category": category,
+                "category": get_category_for_tech(tech),
                 "raw_count": count,
-                "score": normalized_score,
-                "size": size,
-                "color": color
+                "score": int(score),
+                "size": self.STAR_SIZES[size_idx],
+                "color": get_color_for_tech(tech)
             })
 
         return tech_list
 
-    def _compute_star_size(self, score: int) -> str:
-        """
-        Détermine la taille de l'étoile selon le score.
-
-        Utilisé pour le rendu visuel de la constellation.
-
-        Args:
-            score: Score normalisé (0-100)
-
-        Returns:
-            Taille: "large", "medium", "small" ou "tiny"
-        """
-        if score >= 80:
-            return "large"
-        elif score >= 50:
-            return "medium"
-        elif score >= 20:
-            return "small"
-        else:
-            return "tiny"
-
     def _compute_stats(self, tech_details: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Calcule des statistiques globales sur le profil.
@@ -4,12 +4,15 @@ Text overlay service for constellation images.
 Adds title, technology labels, and watermark with simple fixed positioning.
 """
 
+import functools
 import logging
 import math
 from pathlib import Path
-from typing import Tuple
+from typing import Iterator, Tuple
 
+import numpy as np
 from PIL import Image, ImageDraw, ImageFilter, ImageFont
+from PIL import __version__ as PIL_VERSION
 
 from config import settings
 from services.technology_mapper import StarTechMapping
@@ -17,6 +20,80 @@ from services.technology_mapper import StarTechMapping
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=8)
+def _sector_table(num_sectors: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Sector center angles and their unit vectors, computed once per sector count.
+
+    Args:
+        num_sectors: Number of sectors to divide circle
+
+    Returns:
+        Tuple (angles, cos, sin) of read-only arrays of shape [num_sectors]
+    """
+    angles = np.arange(num_sectors) * (2 * math.pi / num_sectors)
+    table = (angles, np.cos(angles), np.sin(angles))
+    for array in table:
+        array.flags.writeable = False
+    return table
+
+
+@functools.lru_cache(maxsize=256)
+def _render_text_mask(text: str, font: ImageFont.FreeTypeFont) -> Image.Image:
+    """
+    Rasterize text once into an "L" coverage mask cropped to its bounding box.
+
+    Tech names recur across constellations, so masks are shared by every
+    TextOverlayService instance (fonts are process-wide, see _load_fonts_cached).
+    The returned image is shared: callers must not modify it.
+
+    Args:
+        text: Text to render
+        font: Font used to render the text
+
+    Returns:
+        "L" image where each pixel is the glyph coverage (0-255)
+    """
+    bbox = font.getbbox(text)
+    mask = Image.new("L", (max(bbox[2] - bbox[0], 1), max(bbox[3] - bbox[1], 1)), 0)
+    ImageDraw.Draw(mask).text((-bbox[0], -bbox[1]), text, font=font, fill=255)
+    return mask
+
+
+@functools.lru_cache(maxsize=1)
+def _load_fonts_cached(
+    font_dir: Path,
+) -> Tuple[ImageFont.FreeTypeFont, ImageFont.FreeTypeFont, ImageFont.FreeTypeFont]:
+    """
+    Load SpaceMono fonts once per process.
+
+    FreeType parsing is shared by every TextOverlayService instance. Labels
+    are plain ASCII, so the BASIC layout engine is used to skip Raqm shaping.
+
+    Args:
+        font_dir: Directory containing the SpaceMono TTF files
+
+    Returns:
+        Tuple (title_font, label_font, watermark_font)
+    """
+    layout = ImageFont.Layout.BASIC
+
+    # Title font: SpaceMono-Bold 34px
+    title_path = font_dir / "SpaceMono-Bold.ttf"
+    title_font = ImageFont.truetype(str(title_path), 34, layout_engine=layout)
+
+    # Label font: SpaceMono-Regular 18px
+    label_path = font_dir / "SpaceMono-Regular.ttf"
+    label_font = ImageFont.truetype(str(label_path), 18, layout_engine=layout)
+
+    # Watermark font: SpaceMono-Regular 16px
+    watermark_path = font_dir / "SpaceMono-Regular.ttf"
+    watermark_font = ImageFont.truetype(str(watermark_path), 16, layout_engine=layout)
+
+    logger.info("SpaceMono fonts loaded (Bold 34px, Regular 18px/16px)")
+    return title_font, label_font, watermark_font
+
+
 class TextOverlayService:
     """
     Add elegant text overlays to constellation images.
@@ -28,6 +105,33 @@ class TextOverlayService:
         >>> final_image = service.compose(image, mappings, title)
     """
 
+    # Label distance from star center (same as fixed placement below star)
+    MIN_DISTANCE_FROM_STAR = 30
+
+    # 8-position model: (horizontal, vertical) side of the star, in order of
+    # preference (below first, then above, sides and corners)
+    LABEL_POSITIONS = (
+        (0, 1),  # Below
+        (0, -1),  # Above
+        (1, 0),  # Right
+        (-1, 0),  # Left
+        (1, 1),  # Below right
+        (-1, 1),  # Below left
+        (1, -1),  # Above right
+        (-1, -1),  # Above left
+    )
+
+    # Title glow: (color, stroke width) layers, blurred together
+    TITLE_GLOW_LAYERS = (
+        ((100, 200, 255, 20), 4),  # Outer cyan glow
+        ((150, 220, 255, 30), 2),  # Inner glow
+    )
+    TITLE_GLOW_BLUR = 4
+
+    # Glow costs about half of the title (stroke-4 raster and blur) for a
+    # faint halo (alpha 20-30 before blur); set False to trade it for speed
+    ENABLE_TITLE_GLOW = True
+
     def __init__(self, font_dir: Path | None = None) -> None:
         """
         Initialize text overlay service.
@@ -38,29 +142,57 @@ class TextOverlayService:
         self.font_dir = font_dir or settings.fonts_dir
         self._load_fonts()
 
-        logger.info("TextOverlayService initialized")
+        # Text measurements memoized per (font, text): textbbox runs a full
+        # FreeType layout, and the same strings are measured several times
+        self._scratch_img = Image.new("RGBA", (1, 1), (0, 0, 0, 0))
+        self._scratch_draw = ImageDraw.Draw(self._scratch_img)
+        self._bbox_cache: dict[tuple[int, str], Tuple[int, int, int, int]] = {}
+
+        # Watermark rendered once per text (see _watermark_sprite)
+        self._watermark_sprites: dict[str, Tuple[Image.Image, Tuple[int, int]]] = {}
+
+        # Labels rendered once per (text, category), see _label_sprite
+        self._label_sprites: dict[tuple[str, str], Tuple[Image.Image, Tuple[int, int]]] = {}
+
+        # Pillow-SIMD builds (opt-in PILLOW_SIMD=1) report a ".postN" version,
+        # e.g. 10.4.0.post0
+        logger.info(f"TextOverlayService initialized (Pillow {PIL_VERSION})")
 
     def _load_fonts(self) -> None:
-        """Load custom SpaceMono fonts from assets."""
-        # Title font: SpaceMono-Bold 34px
-        title_path = self.font_dir / "SpaceMono-Bold.ttf"
-        self.title_font = ImageFont.truetype(str(title_path), 34)
+        """Load custom SpaceMono fonts from assets (cached per process)."""
+        self.title_font, self.label_font, self.watermark_font = _load_fonts_cached(
+            Path(self.font_dir)
+        )
 
-        # Label font: SpaceMono-Regular 18px
-        label_path = self.font_dir / "SpaceMono-Regular.ttf"
-        self.label_font = ImageFont.truetype(str(label_path), 18)
+    def _measure(
+        self, text: str, font: ImageFont.FreeTypeFont
+    ) -> Tuple[int, int, int, int]:
+        """
+        Measure text bounding box at origin, with memoization.
+
+        textbbox is translation-invariant for integer positions, so callers
+        offset the cached box instead of measuring again.
 
-        # Watermark font: SpaceMono-Regular 16px
-        watermark_path = self.font_dir / "SpaceMono-Regular.ttf"
-        self.watermark_font = ImageFont.truetype(str(watermark_path), 16)
+        Args:
+            text: Text to measure
+            font: Font used to render the text
 
-        logger.info("SpaceMono fonts loaded (Bold 34px, Regular 18px/16px)")
+        Returns:
+            Bounding box (x1, y1, x2, y2) of text drawn at (0, 0)
+        """
+        key = (id(font), text)
+        bbox = self._bbox_cache.get(key)
+        if bbox is None:
+            bbox = self._scratch_draw.textbbox((0, 0), text, font=font)
+            self._bbox_cache[key] = bbox
+        return bbox
 
     def compose(
         self,
         image: Image.Image,
         mappings: list[StarTechMapping],
         title: str,
+        copy: bool = True,
     ) -> Image.Image:
         """
         Add all text overlays to image.
@@ -69,6 +201,8 @@ class TextOverlayService:
             image: Base constellation image
             mappings: Star-technology mappings
             title: Constellation title
+            copy: If False and image is already RGBA, draw on it in place
+                (saves a full W×H×4 copy when the caller discards the base)
 
         Returns:
             Image with text overlays
@@ -76,17 +210,23 @@ class TextOverlayService:
         Example:
             >>> final = service.compose(image, mappings, "La Constellation")
         """
-        # Work on a copy
-        result = image.copy()
-
-        # Add title
-        result = self.add_title(result, title)
+        # Single RGBA conversion (convert() also gives us a working copy)
+        if copy or image.mode != "RGBA":
+            result = image.convert("RGBA")
+        else:
+            result = image
+
+        # Each phase (and each label) is drawn on its own overlay and composited
+        # in place: ImageDraw replaces pixels instead of blending, so drawing
+        # everything onto one shared overlay would let a label erase the title
+        # or an earlier label under it
+        self._composite_title(result, title)
 
         # Add technology labels with fixed positioning
-        result = self.add_tech_labels(result, mappings)
+        self._composite_labels(result, mappings)
 
-        # Add watermark
-        result = self.add_watermark(result)
+        # Add watermark (cached sprite)
+        self._composite_watermark(result)
 
         logger.info("Text composition complete")
         return result
@@ -108,72 +248,101 @@ class TextOverlayService:
         Returns:
             Image with title
         """
-        # Convert to RGBA if needed
-        if image.mode != "RGBA":
-            image = image.convert("RGBA")
+        # Single RGBA conversion (also the working copy, composited in place)
+        image = image.convert("RGBA")
+        self._composite_title(image, title)
 
-        # Use SpaceMono-Bold 34px for title
-        title_font = self.title_font
+        return image
+
+    def _composite_title(self, image: Image.Image, title: str) -> None:
+        """
+        Draw the title on a title-sized tile and composite it in place.
 
-        # Create temporary draw to measure text
-        temp_draw = ImageDraw.Draw(image)
-        bbox = temp_draw.textbbox((0, 0), title, font=title_font)
+        Args:
+            image: RGBA image to draw on
+            title: Title text
+        """
+        # Title-sized tile (glow extent) instead of a full-image overlay
+        (x, y), extent = self._title_layout(image.width, title)
+        tile, origin = self._new_tile(extent, image.size)
+        self._draw_title(tile, title, (x - origin[0], y - origin[1]))
+        image.alpha_composite(tile, dest=origin)
+
+    def _title_layout(
+        self, image_width: int, title: str
+    ) -> Tuple[Tuple[int, int], Tuple[int, int, int, int]]:
+        """
+        Compute title text position and the extent touched by glow and stroke.
+
+        Args:
+            image_width: Image width (title is centered horizontally)
+            title: Title text
+
+        Returns:
+            Tuple ((x, y), extent) in image coordinates
+        """
+        bbox = self._measure(title, self.title_font)
         text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
 
-        # Center horizontally, position lower (80px from top)
-        x = (image.width - text_width) // 2
+        # Center horizontally, position lower (60px from top)
+        x = (image_width - text_width) // 2
         y = 60
 
-        # Create overlay for effects
-        overlay = Image.new("RGBA", image.size, (0, 0, 0, 0))
-
-        # 1. Draw cyan glow (outer layer)
-        glow_layer = Image.new("RGBA", image.size, (0, 0, 0, 0))
-        glow_draw = ImageDraw.Draw(glow_layer)
-
-        # Multiple layers of glow (subtle for elegance)
-        glow_colors = [
-            ((100, 200, 255, 20), 4),  # Outer cyan glow
-            ((150, 220, 255, 30), 2),  # Inner glow
-        ]
-
-        for color, offset in glow_colors:
-            for dx in range(-offset, offset + 1):
-                for dy in range(-offset, offset + 1):
-                    if dx * dx + dy * dy <= offset * offset:
-                        glow_draw.text(
-                            (x + dx, y + dy),
-                            title,
-                            font=title_font,
-                            fill=color,
-                        )
-
-        # Apply blur to glow
-        glow_layer = glow_layer.filter(ImageFilter.GaussianBlur(radius=4))
-        overlay = Image.alpha_composite(overlay, glow_layer)
-
-        # 2. Draw text stroke (outline)
-        overlay_draw = ImageDraw.Draw(overlay)
-        stroke_offset = 2
-        for dx in range(-stroke_offset, stroke_offset + 1):
-            for dy in range(-stroke_offset, stroke_offset + 1):
-                if dx != 0 or dy != 0:
-                    overlay_draw.text(
-                        (x + dx, y + dy),
-                        title,
-                        font=title_font,
-                        fill=(0, 0, 0, 200),
-                    )
-
-        # 3. Draw main title text (bright white)
-        overlay_draw.text((x, y), title, font=title_font, fill=(255, 255, 255, 255))
-
-        # Composite all effects
-        result = Image.alpha_composite(image, overlay)
+        # Widest glow stroke plus the blur support (3 sigma) around the glyphs
+        pad = max(offset for _, offset in self.TITLE_GLOW_LAYERS) + 3 * self.TITLE_GLOW_BLUR
+        extent = (x + bbox[0] - pad, y + bbox[1] - pad, x + bbox[2] + pad, y + bbox[3] + pad)
+
+        return (x, y), extent
+
+    def _draw_title(self, tile: Image.Image, title: str, position: Tuple[int, int]) -> None:
+        """
+        Draw title with glow and stroke onto a transparent title tile.
+
+        Args:
+            tile: Transparent RGBA tile covering the title extent
+            title: Title text
+            position: Title text position in tile coordinates
+        """
+        # Use SpaceMono-Bold 34px for title
+        title_font = self.title_font
+
+        # draw.text(stroke_width=w) rasterizes the stroke then the plain text
+        # on every call: rasterize each distinct mask once and stamp it with
+        # the same sequence instead (identical pixels, 3 FreeType passes
+        # instead of 6)
+        glow_layers = self.TITLE_GLOW_LAYERS if self.ENABLE_TITLE_GLOW else ()
+        stroke_widths = {0, 2} | {offset for _, offset in glow_layers}
+        masks = {width: self._stroked_mask(title, title_font, width) for width in stroke_widths}
+
+        def stamp(
+            target: ImageDraw.ImageDraw,
+            width: int,
+            color: Tuple[int, int, int, int],
+        ) -> None:
+            mask, (dx, dy) = masks[width]
+            target.bitmap((position[0] + dx, position[1] + dy), mask, fill=color)
+
+        # 1. Draw cyan glow on its own layer: the tile covers the glow blur,
+        # so the blurred layer equals the blurred full-size layer. Multiple
+        # layers of glow (subtle for elegance), each dilated by a stroke mask
+        if glow_layers:
+            glow_layer = Image.new("RGBA", tile.size, (0, 0, 0, 0))
+            glow_draw = ImageDraw.Draw(glow_layer)
+
+            for color, offset in glow_layers:
+                stamp(glow_draw, offset, color)
+                stamp(glow_draw, 0, color)
+
+            # Apply blur to glow
+            glow_layer = glow_layer.filter(ImageFilter.GaussianBlur(radius=self.TITLE_GLOW_BLUR))
+            tile.alpha_composite(glow_layer)
+
+        # 2-3. Draw text stroke (outline) and main title text (bright white)
+        draw = ImageDraw.Draw(tile)
+        stamp(draw, 2, (0, 0, 0, 200))
+        stamp(draw, 0, (255, 255, 255, 255))
 
         logger.debug(f"Added title with glow: {title}")
-        return result
 
     def add_tech_labels(
         self,
@@ -190,20 +359,140 @@ class TextOverlayService:
         Returns:
             Image with labels
         """
-        draw = ImageDraw.Draw(image)
+        # Single RGBA conversion (also the working copy, composited in place)
+        image = image.convert("RGBA")
+        self._composite_labels(image, mappings)
+
+        return image
+
+    def _composite_labels(
+        self,
+        image: Image.Image,
+        mappings: list[StarTechMapping],
+    ) -> None:
+        """
+        Draw each technology label on its own tile and composite it in place.
+
+        Labels are blended one after the other, so an overlapping label is
+        drawn over (not instead of) the title and the labels placed before it.
+
+        Args:
+            image: RGBA image to draw on
+            mappings: Star-technology mappings
+        """
+        for x, y, tech_name, category in self._iter_label_positions(mappings, image.size):
+            # Cached label-sized sprite instead of drawing the label again
+            sprite, (offset_x, offset_y) = self._label_sprite(tech_name, category)
+            self._composite_sprite(image, sprite, (x + offset_x, y + offset_y))
+
+        logger.debug(f"Added {len(mappings)} technology labels")
+
+    def _label_sprite(self, text: str, category: str) -> Tuple[Image.Image, Tuple[int, int]]:
+        """
+        Render a label (background, shadow and text) once per text and category.
+
+        A label only depends on its text: its position just offsets the
+        sprite. Tech names come from the technology dictionary, so the cache
+        stays bounded.
 
+        Args:
+            text: Label text
+            category: Technology category
+
+        Returns:
+            Tuple (sprite, offset) where offset is the sprite top-left
+            relative to the label position
+        """
+        key = (text, category)
+        cached = self._label_sprites.get(key)
+        if cached is not None:
+            return cached
+
+        box = self._label_box(0, 0, text)
+        sprite = Image.new("RGBA", (box[2] - box[0] + 1, box[3] - box[1] + 1), (0, 0, 0, 0))
+        self._draw_premium_label(ImageDraw.Draw(sprite), -box[0], -box[1], text, category)
+
+        cached = (sprite, (box[0], box[1]))
+        self._label_sprites[key] = cached
+        return cached
+
+    def _composite_sprite(
+        self, image: Image.Image, sprite: Image.Image, dest: Tuple[int, int]
+    ) -> None:
+        """
+        Composite a sprite in place at dest, clipped to the image.
+
+        Args:
+            image: RGBA image to draw on
+            sprite: RGBA sprite
+            dest: Sprite top-left in image coordinates (may be negative)
+        """
+        # Skip the part of the sprite above/left of 0 (right/bottom overflow
+        # is clipped by alpha_composite itself)
+        source = (max(-dest[0], 0), max(-dest[1], 0))
+        if source[0] < sprite.width and source[1] < sprite.height:
+            image.alpha_composite(sprite, dest=(max(dest[0], 0), max(dest[1], 0)), source=source)
+
+    def _new_tile(
+        self, box: Tuple[int, int, int, int], image_size: Tuple[int, int]
+    ) -> Tuple[Image.Image, Tuple[int, int]]:
+        """
+        Allocate a transparent tile covering box, clipped to the image.
+
+        Args:
+            box: Inclusive drawing box (x1, y1, x2, y2) in image coordinates
+            image_size: Image dimensions (width, height)
+
+        Returns:
+            Tuple (tile, origin) where origin is the tile top-left in the image
+        """
+        x1, y1 = max(box[0], 0), max(box[1], 0)
+        x2, y2 = min(box[2] + 1, image_size[0]), min(box[3] + 1, image_size[1])
+        tile = Image.new("RGBA", (max(x2 - x1, 1), max(y2 - y1, 1)), (0, 0, 0, 0))
+        return tile, (x1, y1)
+
+    def _label_box(self, x: int, y: int, text: str) -> Tuple[int, int, int, int]:
+        """
+        Compute the label background box (text bbox plus padding).
+
+        Args:
+            x, y: Label position (top-left)
+            text: Label text
+
+        Returns:
+            Label bounding box (x1, y1, x2, y2), inclusive
+        """
+        # Cached box at origin, shifted to x, y
+        bx1, by1, bx2, by2 = self._measure(text, self.label_font)
+        padding = 8  # Generous padding
+        return (bx1 + x - padding, by1 + y - padding, bx2 + x + padding, by2 + y + padding)
+
+    def _iter_label_positions(
+        self,
+        mappings: list[StarTechMapping],
+        image_size: Tuple[int, int],
+    ) -> Iterator[Tuple[int, int, str, str]]:
+        """
+        Yield label positions for every mapping that can be placed.
+
+        Args:
+            mappings: Star-technology mappings
+            image_size: Image dimensions (width, height)
+
+        Yields:
+            Tuple (x, y, tech_name, category) for each placed label
+        """
         for mapping in mappings:
             star = mapping.star
             tech_name = mapping.tech.name
             category = mapping.tech.category
 
-            # Find position (30px below star)
+            # Find position (30px below star, or first fitting side)
             position = self._find_label_position(
-                draw,
                 star.x,
                 star.y,
                 tech_name,
-                image.size,
+                image_size,
             )
 
             if position is None:
@@ -213,26 +502,16 @@ class TextOverlayService:
                 continue
 
             x, y = position
-
-            # Draw premium label
-            image, label_box = self._draw_premium_label(
-                image, x, y, tech_name, category
-            )
-
-            # Update draw object after image modification
-            draw = ImageDraw.Draw(image)
-
-        logger.debug(f"Added {len(mappings)} technology labels")
-        return image
+            yield x, y, tech_name, category
 
     def _draw_premium_label(
         self,
-        image: Image.Image,
+        draw: ImageDraw.ImageDraw,
         x: int,
         y: int,
         text: str,
         category: str,
-    ) -> Tuple[Image.Image, Tuple[int, int, int, int]]:
+    ) -> Tuple[int, int, int, int]:
         """
         Draw minimal elegant label.
 
@@ -243,107 +522,130 @@ class TextOverlayService:
         - Clean Space Mono typography
 
         Args:
-            image: Base image
+            draw: Draw handle bound to a transparent overlay
             x, y: Label position (top-left)
             text: Label text
             category: Technology category (unused, kept for compatibility)
 
         Returns:
-            Tuple of (modified image, label bounding box)
+            Label bounding box
         """
-        # Convert to RGBA if needed
-        if image.mode != "RGBA":
-            image = image.convert("RGBA")
-
-        # Calculate text dimensions
-        draw = ImageDraw.Draw(image)
-        bbox = draw.textbbox((x, y), text, font=self.label_font)
-        padding = 8  # Generous padding
+        # Calculate text dimensions (cached box at origin, shifted to x, y)
+        bx1, by1, _, _ = self._measure(text, self.label_font)
+        bbox = (bx1 + x, by1 + y)
         corner_radius = 6
 
-        label_box = (
-            bbox[0] - padding,
-            bbox[1] - padding,
-            bbox[2] + padding,
-            bbox[3] + padding,
-        )
-
-        # Create overlay
-        overlay = Image.new("RGBA", image.size, (0, 0, 0, 0))
-        overlay_draw = ImageDraw.Draw(overlay)
+        label_box = self._label_box(x, y, text)
 
         # 1. Simple rounded background (dark, semi-transparent)
-        overlay_draw.rounded_rectangle(
+        draw.rounded_rectangle(
             label_box, radius=corner_radius, fill=(20, 20, 30, 180)  # Dark gray, 70% opacity
         )
 
+        # Rasterize the text once as an alpha mask, stamped for shadow and text
+        mask = self._text_mask(text, self.label_font)
+
         # 2. Text shadow (subtle)
-        overlay_draw.text(
-            (x + 1, y + 1), text, font=self.label_font, fill=(0, 0, 0, 150)
-        )
+        draw.bitmap((bbox[0] + 1, bbox[1] + 1), mask, fill=(0, 0, 0, 150))
 
         # 3. Main text (white)
-        overlay_draw.text((x, y), text, font=self.label_font, fill=(255, 255, 255, 255))
+        draw.bitmap((bbox[0], bbox[1]), mask, fill=(255, 255, 255, 255))
+
+        return label_box
+
+    def _stroked_mask(
+        self, text: str, font: ImageFont.FreeTypeFont, stroke_width: int
+    ) -> Tuple[Image.Image, Tuple[int, int]]:
+        """
+        Rasterize text (or only its stroke) into a single-channel coverage mask.
 
-        # Composite
-        result = Image.alpha_composite(image, overlay)
+        Same mask draw.text() renders internally: with stroke_width > 0 it
+        covers the stroke only, draw.text() then stamps the plain text on top.
 
-        return result, label_box
+        Args:
+            text: Text to render
+            font: Font used to render the text
+            stroke_width: Stroke width (0 for the plain text)
+
+        Returns:
+            Tuple (mask, offset): mask is an "L" image where each pixel is the
+            coverage (0-255) of the text, or of its stroke only when
+            stroke_width > 0; offset is the mask top-left relative to the
+            draw.text() anchor
+        """
+        core, offset = font.getmask2(text, "L", stroke_width=stroke_width)
+        # getmask2 returns a core image: copy its pixels into a regular Image
+        # to stamp it with draw.bitmap()
+        return Image.frombytes("L", core.size, bytes(core)), offset
+
+    def _text_mask(self, text: str, font: ImageFont.FreeTypeFont) -> Image.Image:
+        """
+        Render text into a single-channel coverage mask (cached per process).
+
+        The mask is cropped to the text bounding box: stamp it at the box
+        top-left with draw.bitmap() to get the same pixels as draw.text().
+
+        Args:
+            text: Text to render
+            font: Font used to render the text
+
+        Returns:
+            "L" image where each pixel is the glyph coverage (0-255)
+        """
+        return _render_text_mask(text, font)
 
     def _find_label_position(
         self,
-        draw: ImageDraw.ImageDraw,
         star_x: int,
         star_y: int,
         text: str,
         image_size: tuple[int, int],
     ) -> tuple[int, int] | None:
         """
-        Place label 30px below star (simple fixed placement).
+        Place label with the 8-position model (30px below star preferred).
+
+        The text is measured once (cached); every candidate box is derived
+        arithmetically from that measurement, without rasterizing.
 
         Args:
-            draw: ImageDraw object
             star_x, star_y: Star coordinates
             text: Label text
             image_size: Image dimensions (width, height)
 
         Returns:
-            (x, y) position or None if out of bounds
+            (x, y) position or None if no candidate fits in the image
         """
         # Calculate label dimensions
-        bbox = draw.textbbox((0, 0), text, font=self.label_font)
+        bbox = self._measure(text, self.label_font)
         label_width = bbox[2] - bbox[0]
         label_height = bbox[3] - bbox[1]
-
-        # Place label 30px below star (center of label at 30px below star center)
-        center_x = star_x
-        center_y = star_y + 30
-
-        # Convert center to top-left corner (Pillow anchor)
-        x = int(center_x - label_width / 2)
-        y = int(center_y - label_height / 2)
-
-        # Check if within image bounds
-        bbox = draw.textbbox((x, y), text, font=self.label_font)
+        distance = self.MIN_DISTANCE_FROM_STAR
         padding = 4
-        test_box = (
-            bbox[0] - padding,
-            bbox[1] - padding,
-            bbox[2] + padding,
-            bbox[3] + padding,
-        )
 
-        if (
-            test_box[0] < 0
-            or test_box[1] < 0
-            or test_box[2] > image_size[0]
-            or test_box[3] > image_size[1]
-        ):
-            logger.warning(f"Label '{text}' at ({star_x}, {star_y}) out of bounds")
-            return None
+        # Bounds check hoisted out of the loop: the padded box fits in the
+        # image exactly when the top-left corner lies in this range
+        min_x, max_x = padding - bbox[0], image_size[0] - bbox[2] - padding
+        min_y, max_y = padding - bbox[1], image_size[1] - bbox[3] - padding
+
+        for side_x, side_y in self.LABEL_POSITIONS:
+            # Label center 30px above/below star; side labels clear the star
+            # horizontally, corner labels have their edge aligned on the star
+            center_x = star_x + side_x * (label_width / 2 + (distance if side_y == 0 else 0))
+            center_y = star_y + side_y * distance
+
+            # Convert center to top-left corner (Pillow anchor)
+            x = int(center_x - label_width / 2)
+            y = int(center_y - label_height / 2)
+
+            if min_x <= x <= max_x and min_y <= y <= max_y:
+                logger.debug(
+                    f"Label '{text}' placed at side {(side_x, side_y)} "
+                    f"of star at ({star_x}, {star_y})"
+                )
+                return (x, y)
 
-        logger.debug(f"Label '{text}' placed 30px below star at ({star_x}, {star_y})")
-        return (x, y)
+        logger.warning(f"Label '{text}' at ({star_x}, {star_y}) out of bounds")
+        return None
 
     def add_watermark(
         self, image: Image.Image, text: str = "Made with <3 by Florian RADUREAU"
@@ -364,21 +666,88 @@ class TextOverlayService:
         Returns:
             Image with watermark
         """
-        # Convert to RGBA if needed
-        if image.mode != "RGBA":
-            image = image.convert("RGBA")
+        # Single RGBA conversion (also the working copy, composited in place)
+        image = image.convert("RGBA")
+        self._composite_watermark(image, text)
+
+        return image
+
+    def _composite_watermark(
+        self, image: Image.Image, text: str = "Made with <3 by Florian RADUREAU"
+    ) -> None:
+        """
+        Composite the cached watermark sprite bottom-right, in place.
+
+        Args:
+            image: RGBA image to draw on
+            text: Watermark text
+        """
+        sprite, (offset_x, offset_y) = self._watermark_sprite(text)
+        (x, y), _ = self._watermark_layout(image.size, text)
+        # Images smaller than the watermark are clipped
+        self._composite_sprite(image, sprite, (x + offset_x, y + offset_y))
+
+        logger.debug(f"Added visible watermark: {text}")
+
+    def _watermark_sprite(self, text: str) -> Tuple[Image.Image, Tuple[int, int]]:
+        """
+        Render the watermark (background and text) once per text.
+
+        The watermark never changes, only its position depends on the image
+        size, so it is rasterized on first use and reused afterwards.
+
+        Args:
+            text: Watermark text
+
+        Returns:
+            Tuple (sprite, offset) where offset is the sprite top-left
+            relative to the text position returned by _watermark_layout
+        """
+        cached = self._watermark_sprites.get(text)
+        if cached is not None:
+            return cached
+
+        # Layout for any image size: only positions relative to (x, y) matter
+        (x, y), bg_box = self._watermark_layout((0, 0), text)
+        bbox = self._measure(text, self.watermark_font)
+        extent = (
+            min(bg_box[0], x + bbox[0]),
+            min(bg_box[1], y + bbox[1]),
+            max(bg_box[2], x + bbox[2]),
+            max(bg_box[3], y + bbox[3]),
+        )
+        sprite = Image.new(
+            "RGBA", (extent[2] - extent[0] + 1, extent[3] - extent[1] + 1), (0, 0, 0, 0)
+        )
+        self._draw_watermark(ImageDraw.Draw(sprite), (0, 0), text, extent[:2])
+
+        cached = (sprite, (extent[0] - x, extent[1] - y))
+        self._watermark_sprites[text] = cached
+        return cached
+
+    def _watermark_layout(
+        self, image_size: Tuple[int, int], text: str
+    ) -> Tuple[Tuple[int, int], Tuple[int, int, int, int]]:
+        """
+        Compute watermark text position and background box (bottom-right).
+
+        Args:
+            image_size: Image dimensions (width, height)
+            text: Watermark text
 
+        Returns:
+            Tuple ((x, y), bg_box) in image coordinates
+        """
         # Calculate text dimensions
-        temp_draw = ImageDraw.Draw(image)
-        bbox = temp_draw.textbbox((0, 0), text, font=self.watermark_font)
+        bbox = self._measure(text, self.watermark_font)
         text_width = bbox[2] - bbox[0]
         text_height = bbox[3] - bbox[1]
 
         # Position bottom-right with margins
         padding = 8
         margin = 20
-        x = image.width - text_width - padding * 2 - margin
-        y = image.height - text_height - padding * 2 - margin
+        x = image_size[0] - text_width - padding * 2 - margin
+        y = image_size[1] - text_height - padding * 2 - margin
 
         # Background box
         bg_box = (
@@ -388,31 +757,50 @@ class TextOverlayService:
             y + text_height + padding,
         )
 
-        # Create overlay for semi-transparent background
-        overlay = Image.new("RGBA", image.size, (0, 0, 0, 0))
-        overlay_draw = ImageDraw.Draw(overlay)
+        return (x, y), bg_box
+
+    def _draw_watermark(
+        self,
+        draw: ImageDraw.ImageDraw,
+        image_size: Tuple[int, int],
+        text: str = "Made with <3 by Florian RADUREAU",
+        origin: Tuple[int, int] = (0, 0),
+    ) -> None:
+        """
+        Draw watermark bottom-right onto a transparent overlay.
+
+        Args:
+            draw: Draw handle bound to the overlay
+            image_size: Image dimensions (width, height)
+            text: Watermark text
+            origin: Overlay top-left in image coordinates (for tiles)
+        """
+        (x, y), bg_box = self._watermark_layout(image_size, text)
+
+        # Shift into overlay coordinates
+        x, y = x - origin[0], y - origin[1]
+        bg_box = (
+            bg_box[0] - origin[0],
+            bg_box[1] - origin[1],
+            bg_box[2] - origin[0],
+            bg_box[3] - origin[1],
+        )
 
         # Draw rounded rectangle background (dark gray, 78% opacity)
-        overlay_draw.rounded_rectangle(
+        draw.rounded_rectangle(
             bg_box,
             radius=6,
             fill=(20, 20, 30, 200),  # Dark background
         )
 
         # Draw text (white, 100% opacity - fully visible)
-        overlay_draw.text(
+        draw.text(
             (x, y),
             text,
             font=self.watermark_font,
             fill=(255, 255, 255, 255),  # Pure white, 100% opaque
         )
 
-        # Composite overlay onto image
-        result = Image.alpha_composite(image, overlay)
-
-        logger.debug(f"Added visible watermark: {text}")
-        return result
-
     def _get_title_zone(
         self, image_size: Tuple[int, int], title: str
     ) -> Tuple[int, int, int, int]:
@@ -428,16 +816,13 @@ class TextOverlayService:
         Returns:
             Tuple (x1, y1, x2, y2) representing title zone with padding
         """
-        # Create temporary image to measure text
-        temp_img = Image.new("RGBA", image_size, (0, 0, 0, 0))
-        temp_draw = ImageDraw.Draw(temp_img)
-        bbox = temp_draw.textbbox((0, 0), title, font=self.title_font)
+        # Measure text (cached, no temporary image)
+        bbox = self._measure(title, self.title_font)
         text_width = bbox[2] - bbox[0]
         text_height = bbox[3] - bbox[1]
 
-        # Same positioning as add_title() (line 138-139)
-        x = (image_size[0] - text_width) // 2
-        y = 60
+        # Same positioning as add_title()
+        (x, y), _ = self._title_layout(image_size[0], title)
 
         # Add padding for glow effects and stroke (from add_title: glow offset=4, stroke=2)
         padding = 15  # Extra safety margin for glow + stroke effects
@@ -463,28 +848,9 @@ class TextOverlayService:
         Returns:
             Tuple (x1, y1, x2, y2) representing watermark zone with padding
         """
-        # Fixed text from add_watermark default
-        text = "Made with <3 by Florian RADUREAU"
-
-        # Create temporary image to measure text
-        temp_img = Image.new("RGBA", image_size, (0, 0, 0, 0))
-        temp_draw = ImageDraw.Draw(temp_img)
-        bbox = temp_draw.textbbox((0, 0), text, font=self.watermark_font)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
-
-        # Same positioning as add_watermark() (line 713-716)
-        padding = 8
-        margin = 20
-        x = image_size[0] - text_width - padding * 2 - margin
-        y = image_size[1] - text_height - padding * 2 - margin
-
-        # Background box with padding (line 719-724)
-        bg_box = (
-            x - padding,
-            y - padding,
-            x + text_width + padding,
-            y + text_height + padding,
+        # Fixed text from add_watermark default, same layout as add_watermark()
+        _, bg_box = self._watermark_layout(
+            image_size, "Made with <3 by Florian RADUREAU"
         )
 
         return bg_box
@@ -498,7 +864,9 @@ class TextOverlayService:
         """
         Check if line segment intersects with rectangle.
 
-        Uses Cohen-Sutherland algorithm for line-rectangle intersection.
+        Uses Liang-Barsky parametric clipping: the segment p1 + u * (p2 - p1),
+        u in [0, 1], is clipped against the four edges and intersects the
+        rectangle if the clipped interval is not empty.
 
         Args:
             line_p1: Line start point (x1, y1)
@@ -509,69 +877,31 @@ class TextOverlayService:
             True if line segment intersects rectangle
 
         Reference:
-            https://en.wikipedia.org/wiki/Cohen%E2%80%93Sutherland_algorithm
+            https://en.wikipedia.org/wiki/Liang%E2%80%93Barsky_algorithm
         """
         x1, y1 = line_p1
         x2, y2 = line_p2
         x_min, y_min, x_max, y_max = rect
-
-        # Cohen-Sutherland outcodes
-        INSIDE = 0  # 0000
-        LEFT = 1    # 0001
-        RIGHT = 2   # 0010
-        BOTTOM = 4  # 0100
-        TOP = 8     # 1000
-
-        def compute_outcode(x: float, y: float) -> int:
-            """Compute outcode for point relative to rectangle."""
-            code = INSIDE
-            if x < x_min:
-                code |= LEFT
-            elif x > x_max:
-                code |= RIGHT
-            if y < y_min:
-                code |= BOTTOM
-            elif y > y_max:
-                code |= TOP
-            return code
-
-        # Compute outcodes for both endpoints
-        outcode1 = compute_outcode(x1, y1)
-        outcode2 = compute_outcode(x2, y2)
-
-        while True:
-            if outcode1 == 0 and outcode2 == 0:
-                # Both points inside rectangle
-                return True
-            elif (outcode1 & outcode2) != 0:
-                # Both points on same side outside rectangle
-                return False
+        dx = x2 - x1
+        dy = y2 - y1
+
+        u1, u2 = 0.0, 1.0
+        for p, q in (
+            (-dx, x1 - x_min),
+            (dx, x_max - x1),
+            (-dy, y1 - y_min),
+            (dy, y_max - y1),
+        ):
+            if p == 0:
+                # Parallel to this edge: reject if outside it
+                if q < 0:
+                    return False
+            elif p < 0:
+                u1 = max(u1, q / p)  # Entering
             else:
-                # Line segment needs clipping
-                # Pick point outside rectangle
-                outcode_out = outcode1 if outcode1 != 0 else outcode2
-
-                # Find intersection point
-                if outcode_out & TOP:
-                    x = x1 + (x2 - x1) * (y_max - y1) / (y2 - y1)
-                    y = y_max
-                elif outcode_out & BOTTOM:
-                    x = x1 + (x2 - x1) * (y_min - y1) / (y2 - y1)
-                    y = y_min
-                elif outcode_out & RIGHT:
-                    y = y1 + (y2 - y1) * (x_max - x1) / (x2 - x1)
-                    x = x_max
-                elif outcode_out & LEFT:
-                    y = y1 + (y2 - y1) * (x_min - x1) / (x2 - x1)
-                    x = x_min
-
-                # Update point and outcode
-                if outcode_out == outcode1:
-                    x1, y1 = x, y
-                    outcode1 = compute_outcode(x1, y1)
-                else:
-                    x2, y2 = x, y
-                    outcode2 = compute_outcode(x2, y2)
+                u2 = min(u2, q / p)  # Leaving
+
+        return u1 <= u2
 
     def _intersects_constellation_lines(
         self,
@@ -582,6 +912,9 @@ class TextOverlayService:
         """
         Check if label box intersects any constellation connection lines.
 
+        Liang-Barsky test (see _line_rectangle_intersect) batched over all
+        connections with NumPy.
+
         Args:
             label_box: Label bounding box (x1, y1, x2, y2)
             connections: List of (star_idx1, star_idx2) tuples
@@ -590,18 +923,40 @@ class TextOverlayService:
         Returns:
             True if label intersects any connection line
         """
-        for conn in connections:
-            idx1, idx2 = conn
+        if not connections:
+            return False
+
+        positions = np.asarray(star_positions, dtype=np.float64)
+        idx = np.asarray(connections, dtype=np.intp)
+        x1, y1 = positions[idx[:, 0]].T
+        x2, y2 = positions[idx[:, 1]].T
+        dx = x2 - x1
+        dy = y2 - y1
+        x_min, y_min, x_max, y_max = label_box
+
+        # Cheap pre-reject: segments whose bounding box misses the label box
+        # cannot intersect it, skip them before the divisions below
+        keep = ~(
+            (np.maximum(x1, x2) < x_min)
+            | (np.minimum(x1, x2) > x_max)
+            | (np.maximum(y1, y2) < y_min)
+            | (np.minimum(y1, y2) > y_max)
+        )
+        if not keep.any():
+            return False
+        x1, y1, dx, dy = x1[keep], y1[keep], dx[keep], dy[keep]
 
-            # Get star positions
-            p1 = star_positions[idx1]
-            p2 = star_positions[idx2]
+        # Edge parameters, shape [4, num_kept_connections]
+        p = np.stack([-dx, dx, -dy, dy])
+        q = np.stack([x1 - x_min, x_max - x1, y1 - y_min, y_max - y1])
 
-            # Check if line segment intersects label box
-            if self._line_rectangle_intersect(p1, p2, label_box):
-                return True
+        with np.errstate(divide="ignore", invalid="ignore"):
+            u = q / p
+        u1 = np.where(p < 0, u, 0.0).max(axis=0, initial=0.0)  # Entering
+        u2 = np.where(p > 0, u, 1.0).min(axis=0, initial=1.0)  # Leaving
+        outside_parallel = ((p == 0) & (q < 0)).any(axis=0)
 
-        return False
+        return bool(((u1 <= u2) & ~outside_parallel).any())
 
     def _min_angular_distance(self, angle1: float, angle2: float) -> float:
         """
@@ -620,7 +975,8 @@ class TextOverlayService:
             >>> service._min_angular_distance(0, 2*math.pi - 0.1)
             0.1  # Wraps around
         """
-        diff = abs(angle1 - angle2)
+        # Reduce to [0, 2π) first: inputs mix [0, 2π) sectors and atan2 [-π, π]
+        diff = abs(angle1 - angle2) % (2 * math.pi)
         return min(diff, 2 * math.pi - diff)
 
     def _point_in_box(
@@ -716,81 +1072,97 @@ class TextOverlayService:
             >>> best_angle, best_score = scores[0]
             >>> print(f"Best sector: {math.degrees(best_angle):.0f}° (score: {best_score:.1f})")
         """
-        sector_size = 2 * math.pi / num_sectors  # e.g., 30° in radians
-        scores = []
-
-        # 1. Calculate angles of all connections for this star
-        connection_angles = []
-        for conn in connections:
-            if star_idx in conn:
-                other_idx = conn[1] if conn[0] == star_idx else conn[0]
-                other_x, other_y = star_positions[other_idx]
-                angle = math.atan2(other_y - star_y, other_x - star_x)
-                connection_angles.append(angle)
-
-        # 2. For each sector, calculate score
-        for i in range(num_sectors):
-            sector_angle = i * sector_size  # Center of sector
-            score = 100.0  # Initial score
-
-            # PENALTY 1: Proximity to connections
-            for conn_angle in connection_angles:
-                angular_distance = self._min_angular_distance(sector_angle, conn_angle)
-                if angular_distance < math.radians(30):  # < 30°
-                    # Progressive penalty: closer = stronger
-                    penalty = 50 * (1 - angular_distance / math.radians(30))
-                    score -= penalty
-
-            # PENALTY 2: Proximity to other already placed labels
-            # Calculate hypothetical label position in this sector
-            test_x = star_x + self.MIN_DISTANCE_FROM_STAR * math.cos(sector_angle)
-            test_y = star_y + self.MIN_DISTANCE_FROM_STAR * math.sin(sector_angle)
-
-            # Count labels within 100px radius
-            nearby_labels = 0
-            for box in occupied_boxes:
-                box_center_x = (box[0] + box[2]) / 2
-                box_center_y = (box[1] + box[3]) / 2
-                distance = math.hypot(test_x - box_center_x, test_y - box_center_y)
-                if distance < 100:
-                    nearby_labels += 1
-
-            score -= nearby_labels * 20  # -20 points per nearby label
-
-            # PENALTY 3: Title zone (forbidden)
-            title_zone = self._get_title_zone(image_size, title)
-            if self._point_in_box((test_x, test_y), title_zone):
-                score -= 200  # Strong penalty
-
-            # PENALTY 4: Watermark zone (forbidden)
-            watermark_zone = self._get_watermark_zone(image_size)
-            if self._point_in_box((test_x, test_y), watermark_zone):
-                score -= 200  # Strong penalty
-
-            # PENALTY 5: Proximity to connection lines
-            # Check if position is within 30px of any line
-            for conn in connections:
-                p1 = star_positions[conn[0]]
-                p2 = star_positions[conn[1]]
-                distance_to_line = self._point_to_line_distance((test_x, test_y), p1, p2)
-                if distance_to_line < 30:
-                    # Progressive penalty
-                    penalty = 30 * (1 - distance_to_line / 30)
-                    score -= penalty
-
-            scores.append((sector_angle, score))
-
-        # Log all sector scores for debugging
-        logger.info(f"Star {star_idx} at ({star_x}, {star_y}) - Sector scores:")
-        logger.info(f"  Connections: {len(connection_angles)} at angles {[f'{math.degrees(a):.0f}°' for a in connection_angles]}")
-
-        # Display all sectors with their scores
-        for sector_angle, score in scores:
-            logger.info(f"    Sector {math.degrees(sector_angle):6.0f}°: score = {score:6.1f}")
-
-        # Sort by score (best first)
-        scores.sort(key=lambda x: x[1], reverse=True)
-
-        logger.info(f"  → Best sector: {math.degrees(scores[0][0]):.0f}° (score: {scores[0][1]:.1f})")
-
-        return scores
+        # 1. Calculate angles of all connections for this star (vectorized)
+        positions = np.asarray(star_positions, dtype=np.float64).reshape(-1, 2)
+        idx = np.asarray(connections, dtype=np.intp).reshape(-1, 2)
+        starts_here = idx[:, 0] == star_idx
+        touches = starts_here | (idx[:, 1] == star_idx)
+        other_idx = np.where(starts_here, idx[:, 1], idx[:, 0])[touches]
+        connection_angles = np.arctan2(
+            positions[other_idx, 1] - star_y, positions[other_idx, 0] - star_x
+        )
+
+        # Forbidden zones do not depend on the sector: compute them once
+        title_zone = self._get_title_zone(image_size, title)
+        watermark_zone = self._get_watermark_zone(image_size)
+
+        # 2. Score all sectors at once (arrays of shape [num_sectors])
+        sector_angles, sector_cos, sector_sin = _sector_table(num_sectors)
+        sector_scores = np.full(num_sectors, 100.0)  # Initial score
+
+        # PENALTY 1: Proximity to connections (< 30°), progressive: closer = stronger
+        if connection_angles.size:
+            # Same as _min_angular_distance (wrap-safe for any angle range)
+            diff = np.abs(sector_angles[:, None] - connection_angles) % (2 * math.pi)
+            angular_distance = np.minimum(diff, 2 * math.pi - diff)
+            penalty = 50 * (1 - angular_distance / math.radians(30))
+            penalty[angular_distance >= math.radians(30)] = 0.0
+            sector_scores -= penalty.sum(axis=1)
+
+        # PENALTY 2: Proximity to other already placed labels
+        # Hypothetical label position in each sector
+        test_x = star_x + self.MIN_DISTANCE_FROM_STAR * sector_cos
+        test_y = star_y + self.MIN_DISTANCE_FROM_STAR * sector_sin
+
+        # Count labels within 100px radius, -20 points per nearby label
+        # (squared distances against 100², no sqrt)
+        if occupied_boxes:
+            boxes = np.asarray(occupied_boxes, dtype=np.float64)
+            box_dx = test_x[:, None] - (boxes[:, 0] + boxes[:, 2]) / 2
+            box_dy = test_y[:, None] - (boxes[:, 1] + boxes[:, 3]) / 2
+            sector_scores -= (box_dx * box_dx + box_dy * box_dy < 10000).sum(axis=1) * 20
+
+        # PENALTY 3-4: Title and watermark zones (forbidden, strong penalty)
+        for zone in (title_zone, watermark_zone):
+            inside = (
+                (zone[0] <= test_x) & (test_x <= zone[2])
+                & (zone[1] <= test_y) & (test_y <= zone[3])
+            )
+            sector_scores -= np.where(inside, 200.0, 0.0)
+
+        # PENALTY 5: Proximity to connection lines (within 30px), progressive
+        # Compared squared against 30², sqrt only for lines within range
+        if connections:
+            x1, y1 = positions[idx[:, 0]].T
+            x2, y2 = positions[idx[:, 1]].T
+            dx = x2 - x1
+            dy = y2 - y1
+            length_sq = dx * dx + dy * dy
+            numerator = dy * test_x[:, None] - dx * test_y[:, None] + x2 * y1 - y2 * x1
+            with np.errstate(divide="ignore", invalid="ignore"):
+                distance_sq = np.where(
+                    length_sq > 0,
+                    numerator * numerator / length_sq,
+                    # Degenerate line (single point): distance to that point
+                    (test_x[:, None] - x1) ** 2 + (test_y[:, None] - y1) ** 2,
+                )
+            # 30 * (1 - distance / 30), zero from 30px on (distance left at 30)
+            distance = np.sqrt(
+                distance_sq, out=np.full_like(distance_sq, 30.0), where=distance_sq < 900
+            )
+            sector_scores -= (30 - distance).sum(axis=1)
+
+        # Sort by score (best first, stable for ties)
+        order = np.argsort(-sector_scores, kind="stable")
+
+        # Log all sector scores for debugging (formatting skipped unless DEBUG)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Star {star_idx} at ({star_x}, {star_y}) - Sector scores:")
+            logger.debug(
+                f"  Connections: {len(connection_angles)} at angles "
+                f"{[f'{math.degrees(a):.0f}°' for a in connection_angles]}"
+            )
+
+            # Display all sectors with their scores
+            for sector_angle, score in zip(sector_angles, sector_scores):
+                logger.debug(
+                    f"    Sector {math.degrees(sector_angle):6.0f}°: score = {score:6.1f}"
+                )
+
+            best = order[0]
+            logger.debug(
+                f"  → Best sector: {math.degrees(sector_angles[best]):.0f}° "
+                f"(score: {sector_scores[best]:.1f})"
+            )
+
+        return [(float(sector_angles[i]), float(sector_scores[i])) for i in order]
@@ -0,0 +1,198 @@
+"""
+Unit tests for StorageService.
+
+Uses mocking to avoid actual Cloud Storage calls during testing.
+"""
+
+import io
+import threading
+from unittest.mock import MagicMock, Mock, patch
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+from services.storage_service import UPLOAD_RETRY, StorageError, StorageService
+
+
+def _make_client(*args: object, **kwargs: object) -> Mock:
+    """Build a fake storage.Client whose blobs expose a public URL."""
+    client = Mock()
+
+    def make_blob(name: str) -> Mock:
+        blob = Mock()
+        blob.public_url = f"https://storage.googleapis.com/bucket/{name}"
+        return blob
+
+    client.bucket.return_value.blob.side_effect = make_blob
+    return client
+
+
+class TestStorageService:
+    """Test suite for StorageService."""
+
+    @pytest.fixture
+    def mock_client(self) -> MagicMock:
+        """Mock storage.Client and default credentials."""
+        with patch("services.storage_service.os.path.exists", return_value=False):
+            with patch(
+                "services.storage_service.google.auth.default",
+                return_value=(Mock(), "project"),
+            ):
+                with patch(
+                    "services.storage_service.storage.Client", side_effect=_make_client
+                ) as client_cls:
+                    yield client_cls
+
+    @pytest.fixture
+    def service(self, mock_client: MagicMock) -> StorageService:
+        """Create a StorageService instance with mocked dependencies."""
+        return StorageService()
+
+    @pytest.fixture
+    def image(self) -> Image.Image:
+        """Create a small test image."""
+        return Image.new("RGBA", (64, 64), (0, 0, 0, 255))
+
+    def test_client_created_lazily(
+        self, service: StorageService, mock_client: MagicMock
+    ) -> None:
+        """Test that no client is built until the bucket is first used."""
+        mock_client.assert_not_called()
+
+        assert service.bucket is service.bucket
+        mock_client.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_upload_returns_public_url(
+        self, service: StorageService, image: Image.Image
+    ) -> None:
+        """Test that upload returns the blob public URL."""
+        url = await service.upload(image, "constellation")
+
+        assert url == "https://storage.googleapis.com/bucket/constellation.png"
+
+    @pytest.mark.asyncio
+    async def test_upload_uses_retry_policy(
+        self, service: StorageService, image: Image.Image
+    ) -> None:
+        """Test that uploads are sent with the backoff retry policy."""
+        bucket = Mock()
+
+        with patch.object(service, "_thread_bucket", return_value=bucket):
+            await service.upload(image)
+
+        blob = bucket.blob.return_value
+        assert blob.upload_from_string.call_args.kwargs["retry"] is UPLOAD_RETRY
+
+    @pytest.mark.asyncio
+    async def test_upload_runs_off_event_loop(
+        self, service: StorageService, image: Image.Image
+    ) -> None:
+        """Test that the blocking upload (and its retry backoff) runs in a worker thread."""
+        threads = []
+
+        with patch.object(
+            service,
+            "_upload_with_retry",
+            side_effect=lambda *args: threads.append(threading.get_ident()),
+        ):
+            await service.upload(image)
+
+        assert threads and threads[0] != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_upload_failure_raises_storage_error(
+        self, service: StorageService, image: Image.Image
+    ) -> None:
+        """Test that upload errors are wrapped in StorageError."""
+        bucket = Mock()
+        bucket.blob.side_effect = RuntimeError("network down")
+
+        with patch.object(service, "_thread_bucket", return_value=bucket):
+            with pytest.raises(StorageError):
+                await service.upload(image)
+
+    @pytest.mark.asyncio
+    async def test_credentials_failure_raises_storage_error(self, image: Image.Image) -> None:
+        """Test that credential errors on first bucket access are wrapped too."""
+        with patch("services.storage_service.os.path.exists", return_value=False):
+            with patch(
+                "services.storage_service.google.auth.default",
+                side_effect=RuntimeError("no credentials"),
+            ):
+                service = StorageService()
+
+                with pytest.raises(StorageError):
+                    await service.upload(image)
+                with pytest.raises(StorageError):
+                    await service.upload_many([(image, None)])
+
+    @pytest.mark.asyncio
+    async def test_upload_many_preserves_order(
+        self, service: StorageService, image: Image.Image
+    ) -> None:
+        """Test that upload_many returns URLs in input order."""
+        names = [f"image-{i}.png" for i in range(5)]
+
+        urls = await service.upload_many([(image, name) for name in names])
+
+        assert urls == [f"https://storage.googleapis.com/bucket/{name}" for name in names]
+
+    @pytest.mark.asyncio
+    async def test_upload_many_uses_thread_clients(
+        self, service: StorageService, mock_client: MagicMock, image: Image.Image
+    ) -> None:
+        """Test that worker threads do not share the main storage client."""
+        await service.upload_many([(image, None), (image, None)])
+
+        # Only clients owned by worker threads: the main one is never built
+        assert mock_client.call_count >= 1
+        assert "client" not in vars(service)
+
+    def test_few_colors_encoded_as_lossless_palette(
+        self, service: StorageService
+    ) -> None:
+        """Test that images with <= 256 colors become exact palette PNGs."""
+        image = Image.new("RGBA", (256, 256), (0, 0, 0, 255))
+        draw = ImageDraw.Draw(image)
+        for i in range(100):
+            draw.rectangle((i * 2, i, i * 2 + 10, i + 10), fill=(i, 255 - i, i * 2, 255))
+
+        decoded = Image.open(io.BytesIO(service._image_to_bytes(image)))
+
+        assert decoded.mode == "P"
+        assert np.array_equal(np.asarray(decoded.convert("RGBA")), np.asarray(image))
+
+    def test_few_colors_with_alpha_round_trip(self, service: StorageService) -> None:
+        """Test that translucent images with <= 256 colors keep exact RGBA values."""
+        image = Image.new("RGBA", (256, 256), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(image)
+        for i in range(100):
+            draw.rectangle((i * 2, i, i * 2 + 10, i + 10), fill=(i, 255 - i, i * 2, i + 50))
+
+        decoded = Image.open(io.BytesIO(service._image_to_bytes(image)))
+
+        assert decoded.mode == "P"
+        assert np.array_equal(np.asarray(decoded.convert("RGBA")), np.asarray(image))
+
+    def test_full_color_kept_without_setting(self, service: StorageService) -> None:
+        """Test that full-color images are not quantized by default."""
+        pixels = np.random.default_rng(0).integers(0, 256, (64, 64, 4), dtype=np.uint8)
+        pixels[..., 3] = 255
+        image = Image.fromarray(pixels, "RGBA")
+
+        decoded = Image.open(io.BytesIO(service._image_to_bytes(image)))
+
+        assert decoded.mode == "RGBA"
+
+    def test_full_color_quantized_with_setting(self, service: StorageService) -> None:
+        """Test that settings.quantize_png forces palette encoding."""
+        pixels = np.random.default_rng(0).integers(0, 256, (64, 64, 4), dtype=np.uint8)
+        pixels[..., 3] = 255
+        image = Image.fromarray(pixels, "RGBA")
+
+        with patch("services.storage_service.settings.quantize_png", True):
+            decoded = Image.open(io.BytesIO(service._image_to_bytes(image)))
+
+        assert decoded.mode == "P"
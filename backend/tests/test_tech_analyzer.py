@@ -1,6 +1,8 @@
 """
 Tests unitaires pour le service TechAnalyzer.
 """
+from collections import Counter
+
 import pytest
 from services.tech_analyzer import TechAnalyzer
 
@@ -59,6 +61,51 @@ class TestTechAnalyzer:
         assert python_tech is not None
         assert python_tech["raw_count"] == 4
 
+    def test_word_boundaries(self):
+        """Test que "java" ne matche pas dans "javascript"."""
+        analyzer = TechAnalyzer()
+        text = "JavaScript developer, javascripting daily"
+
+        counts = analyzer._count_tech_occurrences(text)
+
+        assert counts["javascript"] == 1
+        assert "java" not in counts
+
+    def test_word_boundaries_accented_neighbours(self):
+        """Test que les lettres accentuées comptent comme caractères de mot."""
+        analyzer = TechAnalyzer()
+        text = "Mon égo, mes goûts, une élite javaé. Stack : go, java, lit."
+
+        counts = analyzer._count_tech_occurrences(text)
+
+        assert counts["go"] == 1
+        assert counts["java"] == 1
+        assert counts["lit"] == 1
+        assert "ts" not in counts
+
+    def test_overlapping_keywords(self):
+        """Test que les mots-clés imbriqués sont comptés indépendamment."""
+        analyzer = TechAnalyzer()
+        text = "React Native and React, deployed with Next.js"
+
+        counts = analyzer._count_tech_occurrences(text)
+
+        assert counts["react native"] == 1
+        assert counts["react"] == 2
+        assert counts["next.js"] == 1
+        assert counts["js"] == 1
+
+    def test_lone_surrogate(self):
+        """Test qu'un surrogate isolé (extraction PDF) ne fait pas échouer le scan."""
+        analyzer = TechAnalyzer()
+        text = "python \ud83d java\ud83dscript"
+
+        counts = analyzer._count_tech_occurrences(text)
+
+        assert counts["python"] == 1
+        assert counts["java"] == 1
+        assert "javascript" not in counts
+
 
 class TestTechScoring:
     """Tests du système de scoring."""
@@ -90,6 +137,21 @@ class TestTechScoring:
         # Python (3x) doit avoir un score plus élevé qu'Angular (1x)
         assert python_score > angular_score
 
+    def test_star_size_thresholds(self):
+        """Test que les seuils de taille d'étoile sont inclusifs."""
+        analyzer = TechAnalyzer()
+        counts = Counter({"python": 100, "java": 80, "go": 50, "rust": 20, "php": 19})
+
+        sizes = {t["name"]: t["size"] for t in analyzer._enrich_tech_data(counts)}
+
+        assert sizes == {
+            "Python": "large",
+            "Java": "large",
+            "Go": "medium",
+            "Rust": "small",
+            "Php": "tiny",
+        }
+
 
 class TestStatsCalculation:
     """Tests du calcul des statistiques."""
@@ -0,0 +1,276 @@
+"""
+Unit tests for TextOverlayService.
+"""
+
+import math
+
+import pytest
+from PIL import Image, ImageChops
+
+from services.star_detector import StarPosition
+from services.technology_mapper import StarTechMapping, TechData
+from services.text_overlay_service import TextOverlayService
+
+
+def _make_mapping(name: str, x: int, y: int) -> StarTechMapping:
+    """Build a star-technology mapping at the given position."""
+    star = StarPosition(x=x, y=y, brightness=255, color=(255, 255, 255), size=20)
+    tech = TechData(name=name, category="Backend", color="#009688", score=100, size="large")
+    return StarTechMapping(star=star, tech=tech)
+
+
+def _changed_box(a: Image.Image, b: Image.Image) -> tuple[int, int, int, int] | None:
+    """Bounding box of pixels whose color differs (getbbox on RGBA only checks alpha)."""
+    return ImageChops.difference(a.convert("RGB"), b.convert("RGB")).getbbox()
+
+
+def _blend_labels(
+    service: TextOverlayService, image: Image.Image, mappings: list[StarTechMapping]
+) -> Image.Image:
+    """Composite each label through its own add_tech_labels call, one after the other."""
+    for mapping in mappings:
+        image = service.add_tech_labels(image, [mapping])
+    return image
+
+
+class TestTextOverlayService:
+    """Test suite for TextOverlayService."""
+
+    @pytest.fixture
+    def service(self) -> TextOverlayService:
+        """Create a TextOverlayService with the bundled fonts."""
+        return TextOverlayService()
+
+    @pytest.fixture
+    def image(self) -> Image.Image:
+        """Create an opaque dark base image."""
+        return Image.new("RGBA", (1024, 1024), (10, 10, 30, 255))
+
+    @pytest.fixture
+    def mappings(self) -> list[StarTechMapping]:
+        """Create a few mappings spread over the canvas."""
+        return [
+            _make_mapping("Python", 300, 300),
+            _make_mapping("Docker", 600, 450),
+            _make_mapping("Angular", 450, 700),
+        ]
+
+    def test_compose_returns_opaque_rgba(
+        self,
+        service: TextOverlayService,
+        image: Image.Image,
+        mappings: list[StarTechMapping],
+    ) -> None:
+        """Test that compose keeps size and produces an opaque RGBA image."""
+        result = service.compose(image, mappings, "La Constellation")
+
+        assert result.mode == "RGBA"
+        assert result.size == image.size
+        assert result.getchannel("A").getextrema() == (255, 255)
+
+    def test_compose_does_not_modify_input(
+        self,
+        service: TextOverlayService,
+        image: Image.Image,
+        mappings: list[StarTechMapping],
+    ) -> None:
+        """Test that compose leaves the base image untouched."""
+        original = image.copy()
+
+        service.compose(image, mappings, "La Constellation")
+
+        assert _changed_box(image, original) is None
+
+    def test_compose_in_place_without_copy(
+        self,
+        service: TextOverlayService,
+        image: Image.Image,
+        mappings: list[StarTechMapping],
+    ) -> None:
+        """Test that copy=False draws directly on an RGBA base image."""
+        original = image.copy()
+
+        result = service.compose(image, mappings, "La Constellation", copy=False)
+
+        assert result is image
+        assert _changed_box(image, original) is not None
+
+    def test_compose_accepts_rgb(
+        self, service: TextOverlayService, mappings: list[StarTechMapping]
+    ) -> None:
+        """Test that RGB inputs are converted once to RGBA."""
+        image = Image.new("RGB", (1024, 1024), (10, 10, 30))
+
+        result = service.compose(image, mappings, "La Constellation")
+
+        assert result.mode == "RGBA"
+
+    def test_compose_matches_individual_steps(
+        self,
+        service: TextOverlayService,
+        image: Image.Image,
+        mappings: list[StarTechMapping],
+    ) -> None:
+        """Test that the fused pass matches title, labels and watermark applied in turn."""
+        fused = service.compose(image, mappings, "La Constellation")
+
+        stepwise = service.add_title(image, "La Constellation")
+        stepwise = service.add_tech_labels(stepwise, mappings)
+        stepwise = service.add_watermark(stepwise)
+
+        assert _changed_box(fused, stepwise) is None
+
+    def test_compose_blends_label_over_title(
+        self, service: TextOverlayService, image: Image.Image
+    ) -> None:
+        """Test that a label overlapping the title is blended over it, not replacing it."""
+        mappings = [_make_mapping("Python", 512, 55)]
+
+        result = service.compose(image, mappings, "La Constellation")
+
+        expected = _blend_labels(service, service.add_title(image, "La Constellation"), mappings)
+        expected = service.add_watermark(expected)
+        assert _changed_box(result, expected) is None
+
+    def test_overlapping_labels_are_blended(
+        self, service: TextOverlayService, image: Image.Image
+    ) -> None:
+        """Test that overlapping labels are each blended over the previous ones."""
+        mappings = [_make_mapping("Python", 500, 500), _make_mapping("Docker", 520, 505)]
+
+        labels = service.add_tech_labels(image, mappings)
+
+        assert _changed_box(labels, _blend_labels(service, image, mappings)) is None
+
+    def test_label_out_of_bounds_is_skipped(self, service: TextOverlayService) -> None:
+        """Test that a label that fits at no candidate position is not drawn."""
+        image = Image.new("RGBA", (60, 60), (10, 10, 30, 255))
+
+        result = service.add_tech_labels(image, [_make_mapping("Kubernetes", 30, 30)])
+
+        assert _changed_box(result, image) is None
+
+    def test_label_falls_back_above_near_bottom(
+        self, service: TextOverlayService, image: Image.Image
+    ) -> None:
+        """Test that a star near the bottom edge gets its label above it."""
+        x, y = service._find_label_position(500, 1010, "Kubernetes", image.size)
+
+        assert y < 1010 - service.MIN_DISTANCE_FROM_STAR // 2
+        assert service._find_label_position(500, 500, "Kubernetes", image.size)[1] > 500
+
+    def test_watermark_drawn_bottom_right(
+        self, service: TextOverlayService, image: Image.Image
+    ) -> None:
+        """Test that the watermark only touches the bottom-right corner."""
+        result = service.add_watermark(image)
+
+        changed = _changed_box(result, image)
+        assert changed is not None
+        assert changed[0] > image.width // 2
+        assert changed[1] > image.height // 2
+
+    def test_title_glow_can_be_disabled(
+        self, service: TextOverlayService, image: Image.Image
+    ) -> None:
+        """Test that ENABLE_TITLE_GLOW=False still draws the title, without halo."""
+        with_glow = service.add_title(image, "La Constellation")
+        service.ENABLE_TITLE_GLOW = False
+
+        without_glow = service.add_title(image, "La Constellation")
+
+        assert _changed_box(without_glow, image) is not None
+        assert _changed_box(without_glow, with_glow) is not None
+
+    def test_measure_is_cached(self, service: TextOverlayService) -> None:
+        """Test that text measurements are memoized per font and text."""
+        bbox = service._measure("Python", service.label_font)
+
+        assert service._measure("Python", service.label_font) is bbox
+        assert service._measure("Python", service.title_font) != bbox
+
+    def test_sector_scores_avoid_connections(self, service: TextOverlayService) -> None:
+        """Test that sectors pointing along a connection score lowest."""
+        star_positions = [(500, 500), (700, 500), (500, 700)]
+        connections = [(0, 1), (0, 2)]
+
+        scores = service._calculate_sector_scores(
+            0, 500, 500, connections, star_positions, [], (1024, 1024), "Titre"
+        )
+
+        assert len(scores) == 12
+        assert [s for _, s in scores] == sorted((s for _, s in scores), reverse=True)
+        worst = {round(math.degrees(angle)) for angle, _ in scores[-2:]}
+        assert worst == {0, 90}
+
+    @pytest.mark.parametrize(
+        ("p1", "p2", "expected"),
+        [
+            ((0, 0), (100, 100), True),  # Crosses the box diagonally
+            ((0, 60), (100, 60), False),  # Passes below the box
+            ((40, 40), (45, 45), True),  # Fully inside
+            ((50, 0), (50, 30), True),  # Touches the top edge
+            ((0, 0), (10, 90), False),  # Passes left of the box
+            ((20, 20), (20, 20), False),  # Degenerate point outside
+        ],
+    )
+    def test_line_rectangle_intersect(
+        self,
+        service: TextOverlayService,
+        p1: tuple[int, int],
+        p2: tuple[int, int],
+        expected: bool,
+    ) -> None:
+        """Test segment/box intersection, alone and batched over connections."""
+        box = (30, 30, 50, 50)
+
+        assert service._line_rectangle_intersect(p1, p2, box) is expected
+        assert service._intersects_constellation_lines(box, [(0, 1)], [p1, p2]) is expected
+
+    def test_watermark_sprite_reused(self, service: TextOverlayService) -> None:
+        """Test that the watermark is rendered once and fits small images."""
+        small = Image.new("RGBA", (120, 40), (10, 10, 30, 255))
+
+        first = service.add_watermark(small)
+        sprite, _ = service._watermark_sprite("Made with <3 by Florian RADUREAU")
+        second = service.add_watermark(small)
+
+        assert service._watermark_sprite("Made with <3 by Florian RADUREAU")[0] is sprite
+        assert _changed_box(first, second) is None
+        assert first.size == small.size
+        assert service.add_watermark(Image.new("RGBA", (10, 10))).size == (10, 10)
+
+    def test_label_sprite_reused(self, service: TextOverlayService) -> None:
+        """Test that a label is rendered once and looks the same at every position."""
+        image = Image.new("RGBA", (400, 200), (10, 10, 30, 255))
+
+        left = service.add_tech_labels(image, [_make_mapping("Python", 100, 100)])
+        sprite, _ = service._label_sprite("Python", "Backend")
+        right = service.add_tech_labels(image, [_make_mapping("Python", 300, 100)])
+
+        assert service._label_sprite("Python", "Backend")[0] is sprite
+        left_box, right_box = _changed_box(left, image), _changed_box(right, image)
+        assert right_box == (left_box[0] + 200, left_box[1], left_box[2] + 200, left_box[3])
+        assert left.crop(left_box).tobytes() == right.crop(right_box).tobytes()
+
+    def test_min_angular_distance_wraps(self, service: TextOverlayService) -> None:
+        """Test angular distance between [0, 2π) sectors and atan2 angles."""
+        assert service._min_angular_distance(0, 2 * math.pi - 0.1) == pytest.approx(0.1)
+        assert service._min_angular_distance(math.radians(330), math.radians(-170)) == (
+            pytest.approx(math.radians(140))
+        )
+
+    def test_sector_scores_wrap_around(self, service: TextOverlayService) -> None:
+        """Test that a connection at -170° only penalizes sectors near 190°."""
+        star_positions = [(500, 500), (300, 465)]  # atan2 ≈ -170°
+
+        scores = dict(
+            (round(math.degrees(angle)), score)
+            for angle, score in service._calculate_sector_scores(
+                0, 500, 500, [(0, 1)], star_positions, [], (1024, 1024), "Titre"
+            )
+        )
+
+        # 330° is 140° away from the connection: no angular penalty
+        assert scores[330] > 50.0
+        assert scores[180] < scores[330]